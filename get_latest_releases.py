@@ -18,12 +18,18 @@ Environment Variables:
     ARTIFACTS_PATH="/path/to/artifacts"
     ARTIFACT_HISTORY="true"           # Fetch all historical releases
     GITHUB_RELEASES_DEBUG="true"      # Enable debug logging
+    GH_CONCURRENCY="8"                # Number of repositories fetched in parallel
+    GITHUB_RELEASES_URING="true"      # Write release notes through io_uring (Linux only)
+    GITHUB_RELEASES_DEEP_MATCH="true" # Also match configured artifacts in release notes
 
 Command Line Arguments:
     --repos owner1/repo1,owner2/repo2
     --artifacts-path /path/to/artifacts
     --history                         # Fetch all historical releases
     --debug                           # Enable debug logging
+    --concurrency 8                   # Number of repositories fetched in parallel
+    --use-uring                       # Write release notes through io_uring (Linux only)
+    --deep-match                      # Also match configured artifacts in release notes
 
 Configuration File (repos.cfg):
     [repositories]
@@ -35,11 +41,17 @@ Configuration File (repos.cfg):
 
     [settings]
     debug = true                      # Enable debug logging
+    concurrency = 8                   # Number of repositories fetched in parallel
+    use_uring = true                  # Write release notes through io_uring (Linux only)
+    deep_match = true                 # Also match configured artifacts in release notes
 
 Default Values:
     artifacts.path = "artifacts"
     artifacts.history = false         # Only fetch latest releases by default
     debug = false                     # Debug logging disabled by default
+    concurrency = 8                   # Up to 8 repositories are fetched at once
+    use_uring = false                 # Standard writes unless io_uring is requested
+    deep_match = false                # Match artifacts by tag and release name only
 
 Output Structure:
     {artifacts_path}/
@@ -64,7 +76,9 @@ Example Usage:
     python get_latest_releases.py
 
 Dependencies:
-    pip install requests
+    pip install "httpx[http2]"
+    pip install orjson                # Optional, faster JSON decoding
+    pip install liburing              # Optional, for --use-uring on Linux
 
 Notes:
     - GitHub API rate limits are strict without authentication:
@@ -75,15 +89,39 @@ Notes:
     - Monorepo artifacts are automatically detected from release tags
       Example: "op-node/v1.10.2" creates artifacts/owner/repo/op-node/v1.10.2.md
     - Release notes are saved in markdown format with release type clearly indicated
+    - Release pages are cached by ETag in {artifacts_path}/.gh_cache.sqlite; unchanged
+      pages are revalidated with a 304 response that does not count against rate limits
+    - The newest tag saved per artifact by a complete history run is remembered in the
+      same file, so later runs stop paginating once they reach releases already saved.
+      Changing the configured artifacts or deep matching starts over from the newest release.
 """
 
 import os
 import sys
-import requests
+import errno
+import json
+import time
+import zlib
+import queue
+import sqlite3
+import itertools
+import httpx
 import argparse
+import threading
 import configparser
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
+
+try:
+    import orjson  # Optional: faster decoding of large release pages
+except ImportError:
+    orjson = None
+
+try:
+    import liburing  # Optional: batched release note writes through io_uring on Linux
+except ImportError:
+    liburing = None
 
 # Constants
 GITHUB_API_BASE = "https://api.github.com"
@@ -93,28 +131,369 @@ HEADERS = {
     "Accept": "application/vnd.github.v3+json",
 }
 DEBUG_ENV_VAR = "GITHUB_RELEASES_DEBUG"
+CONCURRENCY_ENV_VAR = "GH_CONCURRENCY"
+DEFAULT_CONCURRENCY = 8
+PREFETCH_PAGES = 4  # Release pages requested concurrently in history mode
+CACHE_FILE = ".gh_cache.sqlite"  # Created inside the artifacts root
+WRITE_QUEUE_SIZE = 1024  # Release notes waiting to be written before producers block
+RATE_LIMIT_WATERMARK = 50  # Start pacing requests below this many remaining calls
+URING_ENV_VAR = "GITHUB_RELEASES_URING"
+DEEP_MATCH_ENV_VAR = "GITHUB_RELEASES_DEEP_MATCH"
+URING_QUEUE_DEPTH = 256  # Writes submitted to io_uring in a single batch
 
 # Add your GitHub token here or use environment variable GITHUB_TOKEN
 GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
 if GITHUB_TOKEN:
     HEADERS["Authorization"] = f"token {GITHUB_TOKEN}"
 
-class ReleaseInfo:
-    def __init__(self, tag: str, body: str, is_prerelease: bool):
-        self.tag = tag
-        self.body = body
-        self.is_prerelease = is_prerelease
+# Decode API responses with orjson when it is installed
+_loads = orjson.loads if orjson else json.loads
+
+class ReleaseInfo(NamedTuple):
+    tag: str
+    body: str
+    is_prerelease: bool
+
+NO_RELEASE_NOTES = "No release notes provided."
+
+def _project_releases(releases: List[dict]) -> List[Optional[Tuple[ReleaseInfo, str, str]]]:
+    """
+    Reduce a decoded page of releases to (ReleaseInfo, name, raw body) tuples, with None for drafts.
+    Drops every unused field (author, assets, urls, ...) as soon as a page is decoded,
+    so prefetched pages and history runs hold only what is needed. The raw body is ''
+    when the release has no notes and shares its string with ReleaseInfo otherwise.
+    Drafts stay in the list as None so the page length still tells whether more pages follow.
+    """
+    projected = []
+    for release in releases:
+        if release['draft']:
+            projected.append(None)
+            continue
+        body = release['body'] or ''
+        projected.append((
+            ReleaseInfo(release['tag_name'], body or NO_RELEASE_NOTES, release['prerelease']),
+            release['name'] or '',
+            body
+        ))
+    return projected
+
+class FetchCache:
+    """
+    On-disk state kept between runs, stored in the artifacts root.
+    - etags: API responses keyed by URL. Stored ETags are sent back as If-None-Match;
+      a 304 reply doesn't count against the rate limit and the body is served from here.
+    - last_seen: newest tag fetched per (repo, artifact), where pagination can stop.
+    - last_seen_settings: the matching settings each repo's last_seen tags were recorded
+      under. Tags recorded under other settings are ignored, since releases may now land
+      in different artifacts.
+    """
+    def __init__(self, path: Path):
+        self.path = path
+        self._conn = None  # Opened on first use so runs without API calls leave no file behind
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS etags "
+                "(url TEXT PRIMARY KEY, etag TEXT, body BLOB, last_seen REAL)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS last_seen "
+                "(repo TEXT, artifact TEXT, tag TEXT, PRIMARY KEY (repo, artifact))"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS last_seen_settings "
+                "(repo TEXT PRIMARY KEY, settings TEXT)"
+            )
+        return self._conn
+
+    def get(self, url: str) -> Optional[Tuple[str, bytes]]:
+        """Return the cached (etag, body) for a URL, or None if not cached."""
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT etag, body FROM etags WHERE url = ?", (url,)
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None:
+            return None
+        try:
+            return row[0], zlib.decompress(row[1])
+        except zlib.error:
+            return None  # Corrupt entry, fetch the page again
+
+    def put(self, url: str, etag: str, body: bytes):
+        """Store the ETag and compressed body of a response."""
+        try:
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO etags VALUES (?, ?, ?, ?)",
+                        (url, etag, zlib.compress(body), time.time())
+                    )
+        except sqlite3.Error:
+            pass
+
+    def get_last_seen(self, repo: str, settings: Optional[str] = None) -> Dict[str, str]:
+        """
+        Return the newest tag fetched for each artifact of a repository.
+        If settings is given, tags recorded under different settings are not returned.
+        """
+        try:
+            with self._lock:
+                conn = self._connect()
+                if settings is not None:
+                    row = conn.execute(
+                        "SELECT settings FROM last_seen_settings WHERE repo = ?", (repo,)
+                    ).fetchone()
+                    if row is None or row[0] != settings:
+                        return {}
+                rows = conn.execute(
+                    "SELECT artifact, tag FROM last_seen WHERE repo = ?", (repo,)
+                ).fetchall()
+        except sqlite3.Error:
+            return {}
+        return dict(rows)
+
+    def set_last_seen(self, repo: str, tags: Dict[str, str], settings: str):
+        """Replace the newest tag fetched for each artifact of a repository, and the settings used."""
+        try:
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    conn.execute("DELETE FROM last_seen WHERE repo = ?", (repo,))
+                    conn.executemany(
+                        "INSERT INTO last_seen VALUES (?, ?, ?)",
+                        [(repo, artifact, tag) for artifact, tag in tags.items()]
+                    )
+                    conn.execute(
+                        "INSERT OR REPLACE INTO last_seen_settings VALUES (?, ?)", (repo, settings)
+                    )
+        except sqlite3.Error:
+            pass
+
+_temp_ids = itertools.count()  # Keeps temporary file names unique within this process
+_no_link_dirs = set()  # Directories on filesystems without hard links, e.g. FAT or many SMB/FUSE mounts
+
+def _open_temp_file(filepath: Path) -> Tuple[int, Path]:
+    """Create a hidden temporary file next to filepath and return its descriptor and path."""
+    tmp_path = filepath.with_name(f".{filepath.name}.{os.getpid()}-{next(_temp_ids)}.tmp")
+    return os.open(str(tmp_path), os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644), tmp_path
+
+def _write_all(fd: int, content: bytes, offset: int = 0):
+    """Write content to a file descriptor, starting at offset."""
+    if offset:
+        os.lseek(fd, offset, os.SEEK_SET)  # Only resuming a short io_uring write needs to seek
+    view = memoryview(content)[offset:]
+    while view:
+        view = view[os.write(fd, view):]
+
+def _finish_release_file(fd: int, tmp_path: Path, filepath: Path, content: bytes, offset: int = 0) -> bool:
+    """
+    Write the rest of content to a temporary file, then link it into place.
+    The final path only appears once its content is complete, so an interrupted
+    run never leaves an empty or truncated note that later runs would skip.
+    Returns False if filepath already exists.
+    """
+    try:
+        try:
+            _write_all(fd, content, offset)
+        finally:
+            os.close(fd)
+        try:
+            os.link(tmp_path, filepath)
+        except FileExistsError:
+            return False
+        except OSError as e:
+            if e.errno not in (errno.EPERM, errno.ENOTSUP, errno.EOPNOTSUPP):
+                raise
+            _no_link_dirs.add(filepath.parent)
+            return _write_exclusive(filepath, content)
+        return True
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+def _write_exclusive(filepath: Path, content: bytes) -> bool:
+    """
+    Create filepath exclusively and write content to it, for filesystems without hard links.
+    The file is removed again if the write fails. Returns False if filepath already exists.
+    """
+    try:
+        fd = os.open(str(filepath), os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+    except FileExistsError:
+        return False
+    try:
+        try:
+            _write_all(fd, content)
+        finally:
+            os.close(fd)
+    except BaseException:
+        filepath.unlink(missing_ok=True)
+        raise
+    return True
+
+def _write_release_file(filepath: Path, content: bytes) -> bool:
+    """Write content to filepath through a temporary file. Returns False if filepath already exists."""
+    if filepath.parent in _no_link_dirs:
+        return _write_exclusive(filepath, content)
+    fd, tmp_path = _open_temp_file(filepath)
+    return _finish_release_file(fd, tmp_path, filepath, content)
+
+class ReleaseNoteWriter:
+    """
+    Writes release note files on a background thread,
+    letting disk I/O overlap with fetching the next pages and repositories.
+    Each submitted file gets a Future resolving to True if it was written,
+    False if it already existed, or the error that stopped the write.
+    """
+    def __init__(self, maxsize: int = WRITE_QUEUE_SIZE):
+        self._write_q = queue.Queue(maxsize=maxsize)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            filepath, content, future = self._write_q.get()
+            try:
+                future.set_result(_write_release_file(filepath, content))
+            except Exception as e:
+                print(f"Error saving release notes to {filepath}: {str(e)}")
+                future.set_exception(e)
+            finally:
+                self._write_q.task_done()
+
+    def submit(self, filepath: Path, content: bytes) -> Future:
+        """Queue encoded content to be written to filepath, blocking if the queue is full."""
+        future = Future()
+        self._write_q.put((filepath, content, future))
+        return future
+
+    def join(self):
+        """Block until every queued file has been written."""
+        self._write_q.join()
+
+class UringReleaseNoteWriter(ReleaseNoteWriter):
+    """
+    Background writer that submits queued writes to io_uring in batches.
+    Each batch of up to URING_QUEUE_DEPTH files costs one submission syscall
+    instead of one write per file. Requires Linux and the liburing package.
+    """
+    def _run(self):
+        try:
+            ring = liburing.Ring()
+            cqe = liburing.Cqe()
+            liburing.io_uring_queue_init(URING_QUEUE_DEPTH, ring)
+        except Exception as e:
+            print(f"Warning: Could not set up io_uring ({str(e)}). Using standard writes.")
+            return super()._run()
+
+        try:
+            while True:
+                # Block for the first write, then take whatever else is already queued
+                batch = [self._write_q.get()]
+                while len(batch) < URING_QUEUE_DEPTH:
+                    try:
+                        batch.append(self._write_q.get_nowait())
+                    except queue.Empty:
+                        break
+                if not self._write_batch(ring, cqe, batch):
+                    break
+        finally:
+            liburing.io_uring_queue_exit(ring)
+        super()._run()
+
+    def _write_batch(self, ring, cqe, batch: List[Tuple[Path, bytes, Future]]) -> bool:
+        """
+        Write a batch of release notes through the ring.
+        Every submitted write is reaped before its descriptor is closed. Whatever the
+        ring did not write is finished synchronously, and False is returned if the
+        ring failed so the writer can stop using it.
+        """
+        files = {}  # Batch index -> (fd, temporary path)
+        written = {}  # Batch index -> bytes written by the ring
+        ring_ok = True
+        try:
+            for index, (filepath, _, future) in enumerate(batch):
+                try:
+                    files[index] = _open_temp_file(filepath)
+                except OSError as e:
+                    print(f"Error saving release notes to {filepath}: {str(e)}")
+                    future.set_exception(e)
+
+            try:
+                prepared = 0
+                for index, (fd, _) in files.items():
+                    sqe = liburing.io_uring_get_sqe(ring)
+                    if sqe is None:
+                        break  # Submission queue full, the rest are written synchronously
+                    liburing.io_uring_prep_write(sqe, fd, batch[index][1], 0)
+                    liburing.io_uring_sqe_set_data64(sqe, index)
+                    prepared += 1
+                submitted = liburing.io_uring_submit(ring) if prepared else 0
+
+                for _ in range(submitted):
+                    liburing.io_uring_wait_cqe(ring, cqe)
+                    index, res = liburing.io_uring_cqe_get_data64(cqe[0]), cqe[0].res
+                    liburing.io_uring_cqe_seen(ring, cqe[0])
+                    if res > 0:
+                        written[index] = res
+                if submitted != prepared:
+                    raise OSError(f"submitted {submitted} of {prepared} writes")
+            except Exception as e:
+                # Writes still in flight put the same bytes at the same offsets,
+                # so rewriting them synchronously below is safe
+                print(f"Warning: io_uring write failed ({str(e)}). Using standard writes.")
+                ring_ok = False
+        finally:
+            for index, (filepath, content, future) in enumerate(batch):
+                try:
+                    if index in files:
+                        # Finish short or failed writes synchronously, then link into place
+                        fd, tmp_path = files[index]
+                        future.set_result(_finish_release_file(fd, tmp_path, filepath, content, written.get(index, 0)))
+                except Exception as e:
+                    print(f"Error saving release notes to {filepath}: {str(e)}")
+                    future.set_exception(e)
+                finally:
+                    self._write_q.task_done()
+        return ring_ok
 
 class GitHubReleaseFetcher:
     def __init__(self):
-        self.session = requests.Session()
+        # HTTP/2 multiplexes concurrent page requests over a single connection
+        self.session = httpx.Client(http2=True, headers=HEADERS, timeout=30.0, follow_redirects=True)
         if not GITHUB_TOKEN:
             print("Warning: No GITHUB_TOKEN found. API rate limits will be restricted.")
             print("Set GITHUB_TOKEN environment variable to increase rate limits.")
-        self.session.headers.update(HEADERS)
+        # Parse the command line and config file once; every setting below reads from these
+        self._args, extra_args = self._build_parser().parse_known_args()
+        self._cfg = self._read_config()
+        self._repo_args = self._parse_repo_args(extra_args)
         self.artifacts_root = self.get_artifacts_path()
+        self.artifacts_root_path = Path(self.artifacts_root)
+        self.cache = FetchCache(self.artifacts_root_path / CACHE_FILE)
         self.debug = self.get_debug_setting()
         self.fetch_history = self.get_history_setting()
+        self.concurrency = self.get_concurrency_setting()
+        self.deep_match = self.get_deep_match_setting()
+        self._print_lock = threading.Lock()
+        self.writer: Optional[ReleaseNoteWriter] = None  # Files are written inline unless set
+        self._ensured_dirs = set()  # Directories already created during this run
+        self._base_paths = {}  # Output directory per (owner, repo, artifact)
+        self._newest_tags = {}  # (newest tag per artifact, settings) from the last fetch of each repo
+        self._mono_cache = {}  # Configured artifacts per repo
+        # Latest known rate limit state, updated from every API response
+        self._rl_lock = threading.Lock()
+        self._rl_limit = None
+        self._rl_remaining = None
+        self._rl_reset = None
+        self._rl_next_at = 0.0  # Earliest time the next paced request may be issued
+        self._rl_in_flight = 0  # Requests sent whose responses have not been counted yet
         self.check_rate_limit()
 
     def check_rate_limit(self):
@@ -122,8 +501,9 @@ class GitHubReleaseFetcher:
         try:
             response = self.session.get(f"{GITHUB_API_BASE}/rate_limit")
             response.raise_for_status()
-            data = response.json()
+            data = _loads(response.content)
             rate = data['resources']['core']
+            self._update_rate_limit(rate['limit'], rate['remaining'], rate['reset'])
             
             self.debug_print(f"GitHub API Rate Limit Status:")
             self.debug_print(f"  Remaining: {rate['remaining']}/{rate['limit']}")
@@ -134,6 +514,111 @@ class GitHubReleaseFetcher:
         except Exception as e:
             print(f"Warning: Could not check rate limit status: {str(e)}")
 
+    def _build_parser(self) -> argparse.ArgumentParser:
+        """Build the command line parser for all settings."""
+        parser = argparse.ArgumentParser(description='Fetch GitHub release notes')
+        parser.add_argument('--repos', help='Comma-separated list of repositories (owner/repo)')
+        parser.add_argument('--artifacts-path', help='Path to store artifact files')
+        parser.add_argument('--history', action='store_true', help='Fetch all historical releases')
+        parser.add_argument('--debug', action='store_true', help='Enable debug logging')
+        parser.add_argument('--concurrency', type=int, help='Number of repositories fetched in parallel')
+        parser.add_argument('--use-uring', action='store_true', help='Write release notes through io_uring (Linux only)')
+        parser.add_argument('--deep-match', action='store_true', help='Also match configured artifacts in release notes')
+        return parser
+
+    def _parse_repo_args(self, args: List[str]) -> argparse.Namespace:
+        """Parse the per-repository --artifacts-{owner}-{repo} flags for all configured repositories."""
+        # Every flag shares the --artifacts- prefix, so abbreviations would be ambiguous
+        parser = argparse.ArgumentParser(description='Fetch GitHub release notes', allow_abbrev=False)
+        repos = dict.fromkeys(repo.strip() for repo in self._configured_repositories() or [])
+        for repo in repos:
+            parser.add_argument(f'--artifacts-{repo.replace("/", "-")}',
+                                dest=f'artifacts_{repo.replace("/", "_")}',
+                                help=f'Comma-separated list of artifacts for {repo}')
+        repo_args, _ = parser.parse_known_args(args)
+        return repo_args
+
+    def _read_config(self) -> configparser.ConfigParser:
+        """
+        Read all existing config files into a single parser.
+        Files are read in reverse priority order so values from the first file listed win.
+        """
+        config = configparser.ConfigParser()
+        config_files = [f for f in reversed(CONFIG_FILE_NAMES) if os.path.exists(f)]
+        if config_files:
+            config.read(config_files)
+        return config
+
+    def _config_value(self, section: str, key: str) -> Optional[str]:
+        """Get a value from the parsed config file, or None if not set."""
+        if section in self._cfg and key in self._cfg[section]:
+            return self._cfg[section][key]
+        return None
+
+    def _update_rate_limit(self, limit: int, remaining: int, reset: int):
+        """Record the latest rate limit state reported by the API."""
+        with self._rl_lock:
+            # Trust the server's count, less the requests still in flight that it may not include yet
+            self._rl_limit = limit
+            self._rl_remaining = remaining - self._rl_in_flight
+            self._rl_reset = reset
+
+    def _get_throttled(self, url: str, **kwargs) -> httpx.Response:
+        """
+        Issue a GET request, pacing calls once the rate limit runs low.
+        Below the watermark, the time until reset is spread evenly over the remaining
+        calls, across all threads, instead of running into a 403 when the budget is exhausted.
+        """
+        # Reserve a time slot under the lock so concurrent workers share one schedule
+        # instead of each spending the same remaining budget
+        sleep_s = 0.0
+        with self._rl_lock:
+            remaining = self._rl_remaining
+            if remaining is not None:
+                # Keep unauthenticated runs (60 calls per hour) from pacing from the first request
+                if remaining < min(RATE_LIMIT_WATERMARK, self._rl_limit // 10):
+                    now = time.time()
+                    slot = max(now, self._rl_next_at)
+                    if remaining <= 0:
+                        # Budget exhausted: wait for the reset, after which it is refilled
+                        slot = max(slot, self._rl_reset)
+                        self._rl_next_at = slot
+                    else:
+                        # Spread the time from this slot to the reset over the remaining calls,
+                        # so the last reserved slot lands on the reset
+                        self._rl_next_at = slot + max(0.0, (self._rl_reset - slot) / remaining)
+                    sleep_s = slot - now
+                # Count this call now rather than when its response reports it
+                self._rl_remaining = remaining - 1
+            self._rl_in_flight += 1
+
+        if sleep_s > 0:
+            if remaining == 0:
+                print(f"GitHub API rate limit reached. Waiting {int(sleep_s)}s for reset")
+            self.debug_print(f"{remaining} API calls remaining, waiting {sleep_s:.1f}s")
+            time.sleep(sleep_s)
+
+        try:
+            response = self.session.get(url, **kwargs)
+        finally:
+            with self._rl_lock:
+                self._rl_in_flight -= 1
+
+        # Revalidated pages (304) do not count against the rate limit, so give the call back
+        if response.status_code == 304:
+            with self._rl_lock:
+                if self._rl_remaining is not None:
+                    self._rl_remaining += 1
+
+        headers = response.headers
+        if all(h in headers for h in ('X-RateLimit-Limit', 'X-RateLimit-Remaining', 'X-RateLimit-Reset')):
+            self._update_rate_limit(
+                int(headers['X-RateLimit-Limit']),
+                int(headers['X-RateLimit-Remaining']),
+                int(headers['X-RateLimit-Reset'])
+            )
+        return response
+
     def get_artifacts_path(self) -> str:
         """Get the root path for artifacts from environment, CLI, or config file."""
         # 1. Check environment variable
@@ -142,19 +627,13 @@ class GitHubReleaseFetcher:
             return env_path
 
         # 2. Check command line arguments
-        parser = argparse.ArgumentParser(description='Fetch GitHub release notes')
-        parser.add_argument('--artifacts-path', help='Path to store artifact files')
-        args, _ = parser.parse_known_args()  # Use known_args to not interfere with other arg parsing
-        if args.artifacts_path:
-            return args.artifacts_path
+        if self._args.artifacts_path:
+            return self._args.artifacts_path
 
         # 3. Check config file
-        for config_file in CONFIG_FILE_NAMES:
-            if os.path.exists(config_file):
-                config = configparser.ConfigParser()
-                config.read(config_file)
-                if 'artifacts' in config and 'path' in config['artifacts']:
-                    return config['artifacts']['path']
+        config_path = self._config_value('artifacts', 'path')
+        if config_path is not None:
+            return config_path
 
         # 4. Default value
         return 'artifacts'
@@ -167,19 +646,13 @@ class GitHubReleaseFetcher:
             return env_debug.lower() in ('true', '1', 'yes', 'on')
 
         # 2. Check command line arguments
-        parser = argparse.ArgumentParser(description='Fetch GitHub release notes')
-        parser.add_argument('--debug', action='store_true', help='Enable debug logging')
-        args, _ = parser.parse_known_args()
-        if args.debug:
+        if self._args.debug:
             return True
 
         # 3. Check config file
-        for config_file in CONFIG_FILE_NAMES:
-            if os.path.exists(config_file):
-                config = configparser.ConfigParser()
-                config.read(config_file)
-                if 'settings' in config and 'debug' in config['settings']:
-                    return config['settings']['debug'].lower() in ('true', '1', 'yes', 'on')
+        config_debug = self._config_value('settings', 'debug')
+        if config_debug is not None:
+            return config_debug.lower() in ('true', '1', 'yes', 'on')
 
         # 4. Default value
         return False
@@ -192,54 +665,131 @@ class GitHubReleaseFetcher:
             return env_history.lower() in ('true', '1', 'yes', 'on')
 
         # 2. Check command line arguments
-        parser = argparse.ArgumentParser(description='Fetch GitHub release notes')
-        parser.add_argument('--history', action='store_true', help='Fetch all historical releases')
-        args, _ = parser.parse_known_args()
-        if args.history:
+        if self._args.history:
+            return True
+
+        # 3. Check config file
+        config_history = self._config_value('artifacts', 'history')
+        if config_history is not None:
+            return config_history.lower() in ('true', '1', 'yes', 'on')
+
+        # 4. Default value
+        return False
+
+    def get_concurrency_setting(self) -> int:
+        """Get the number of repositories to fetch in parallel from environment, CLI, or config file."""
+        # 1. Check environment variable
+        env_concurrency = os.getenv(CONCURRENCY_ENV_VAR)
+        if env_concurrency:
+            return max(1, int(env_concurrency))
+
+        # 2. Check command line arguments
+        if self._args.concurrency:
+            return max(1, self._args.concurrency)
+
+        # 3. Check config file
+        config_concurrency = self._config_value('settings', 'concurrency')
+        if config_concurrency is not None:
+            return max(1, int(config_concurrency))
+
+        # 4. Default value
+        return DEFAULT_CONCURRENCY
+
+    def get_deep_match_setting(self) -> bool:
+        """Get release notes matching setting from environment, CLI, or config file."""
+        # 1. Check environment variable
+        env_deep_match = os.getenv(DEEP_MATCH_ENV_VAR)
+        if env_deep_match is not None:
+            return env_deep_match.lower() in ('true', '1', 'yes', 'on')
+
+        # 2. Check command line arguments
+        if self._args.deep_match:
+            return True
+
+        # 3. Check config file
+        config_deep_match = self._config_value('settings', 'deep_match')
+        if config_deep_match is not None:
+            return config_deep_match.lower() in ('true', '1', 'yes', 'on')
+
+        # 4. Default value
+        return False
+
+    def get_uring_setting(self) -> bool:
+        """Get io_uring write setting from environment, CLI, or config file."""
+        # 1. Check environment variable
+        env_uring = os.getenv(URING_ENV_VAR)
+        if env_uring is not None:
+            return env_uring.lower() in ('true', '1', 'yes', 'on')
+
+        # 2. Check command line arguments
+        if self._args.use_uring:
             return True
 
         # 3. Check config file
-        for config_file in CONFIG_FILE_NAMES:
-            if os.path.exists(config_file):
-                config = configparser.ConfigParser()
-                config.read(config_file)
-                if 'artifacts' in config and 'history' in config['artifacts']:
-                    return config['artifacts']['history'].lower() in ('true', '1', 'yes', 'on')
+        config_uring = self._config_value('settings', 'use_uring')
+        if config_uring is not None:
+            return config_uring.lower() in ('true', '1', 'yes', 'on')
 
         # 4. Default value
         return False
 
+    def create_writer(self) -> ReleaseNoteWriter:
+        """Create the background writer, using io_uring when enabled and available."""
+        if self.get_uring_setting():
+            if liburing is not None and sys.platform.startswith('linux'):
+                self.debug_print("Writing release notes through io_uring")
+                return UringReleaseNoteWriter()
+            print("Warning: io_uring writes need Linux and the liburing package. Using standard writes.")
+        return ReleaseNoteWriter()
+
     def debug_print(self, message: str):
         """Print debug message if debug mode is enabled."""
         if self.debug:
             print(f"DEBUG: {message}")
 
-    def get_repositories(self) -> List[str]:
-        """Get repository list from environment variable, CLI, or config file."""
+    def _configured_repositories(self) -> Optional[List[str]]:
+        """Get repository list from environment variable, CLI, or config file, or None if not set."""
         # 1. Check environment variable
         repos = os.getenv(ENV_VAR_NAME)
         if repos:
             return repos.split(',')
 
         # 2. Check command line arguments
-        parser = argparse.ArgumentParser(description='Fetch GitHub release notes')
-        parser.add_argument('--repos', help='Comma-separated list of repositories (owner/repo)')
-        args, _ = parser.parse_known_args()
-        if args.repos:
-            return args.repos.split(',')
+        if self._args.repos:
+            return self._args.repos.split(',')
 
         # 3. Check config file
-        for config_file in CONFIG_FILE_NAMES:
-            if os.path.exists(config_file):
-                config = configparser.ConfigParser()
-                config.read(config_file)
-                if 'repositories' in config and 'repos' in config['repositories']:
-                    return config['repositories']['repos'].split(',')
+        config_repos = self._config_value('repositories', 'repos')
+        if config_repos is not None:
+            return config_repos.split(',')
+
+        return None
+
+    def get_repositories(self) -> List[str]:
+        """Get repository list from environment variable, CLI, or config file."""
+        repos = self._configured_repositories()
+        if repos:
+            return repos
 
         print("Error: No repositories specified. Please use environment variable, config file, or --repos argument.")
         sys.exit(1)
 
+    def get_last_seen_settings(self, repo: str) -> str:
+        """
+        Describe the settings that decide which artifact a release is matched to.
+        Adding an artifact or enabling deep matching moves older releases into other
+        artifacts, below where the previous run's last seen tags would stop pagination.
+        """
+        artifacts = ",".join(sorted(self.get_monorepo_artifacts(repo)))
+        return f"artifacts={artifacts};deep_match={self.deep_match}"
+
     def get_monorepo_artifacts(self, repo: str) -> List[str]:
+        """Get list of artifacts for a monorepo, resolved once per repository."""
+        if repo not in self._mono_cache:
+            self._mono_cache[repo] = self._resolve_monorepo_artifacts(repo)
+        return self._mono_cache[repo]
+
+    def _resolve_monorepo_artifacts(self, repo: str) -> List[str]:
         """Get list of artifacts for a monorepo from environment, CLI, or config file."""
         # 1. Check environment variable
         env_artifacts = os.getenv(f'MONOREPO_ARTIFACTS_{repo.replace("/", "_").upper()}')
@@ -247,25 +797,59 @@ class GitHubReleaseFetcher:
             return env_artifacts.split(',')
 
         # 2. Check command line arguments
-        parser = argparse.ArgumentParser(description='Fetch GitHub release notes')
-        parser.add_argument(f'--artifacts-{repo.replace("/", "-")}', 
-                           help=f'Comma-separated list of artifacts for {repo}')
-        args, _ = parser.parse_known_args()
-        arg_name = f'artifacts_{repo.replace("/", "_")}'
-        if hasattr(args, arg_name) and getattr(args, arg_name):
-            return getattr(args, arg_name).split(',')
+        cli_artifacts = getattr(self._repo_args, f'artifacts_{repo.replace("/", "_")}', None)
+        if cli_artifacts:
+            return cli_artifacts.split(',')
 
         # 3. Check config file
-        for config_file in CONFIG_FILE_NAMES:
-            if os.path.exists(config_file):
-                config = configparser.ConfigParser()
-                config.read(config_file)
-                if 'monorepos' in config and repo in config['monorepos']:
-                    return config['monorepos'][repo].split(',')
+        config_artifacts = self._config_value('monorepos', repo)
+        if config_artifacts is not None:
+            return config_artifacts.split(',')
 
         # 4. Default value (empty string for non-monorepos)
         return ['']
 
+    def _fetch_releases_page(self, repo: str, page: int, per_page: int) -> Tuple[httpx.Response, Optional[list]]:
+        """
+        Request a single page of releases for a repository, revalidating against the ETag cache.
+        Returns the response and the releases reduced by _project_releases, or None for
+        releases if the request failed.
+        """
+        url = f"{GITHUB_API_BASE}/repos/{repo}/releases"
+        params = {
+            'page': page,
+            'per_page': per_page
+        }
+        cache_key = f"{url}?page={page}&per_page={per_page}"
+        cached = self.cache.get(cache_key)
+        headers = {'If-None-Match': cached[0]} if cached else None
+
+        self.debug_print(f"Fetching page {page} for {repo}")
+        response = self._get_throttled(url, params=params, headers=headers)
+
+        if cached and response.status_code == 304:
+            try:
+                releases = _project_releases(_loads(cached[1]))
+                self.debug_print(f"Page {page} for {repo} not modified, using cached releases")
+                return response, releases
+            except ValueError:
+                self.debug_print(f"Cached page {page} for {repo} is corrupt, fetching it again")
+                response = self._get_throttled(url, params=params)
+        if response.is_error:
+            return response, None
+
+        releases = _project_releases(_loads(response.content))
+        etag = response.headers.get('ETag')
+        if etag:
+            self.cache.put(cache_key, etag, response.content)
+        return response, releases
+
+    def _prefetch_releases_pages(self, repo: str, first_page: int, per_page: int) -> List[Tuple[httpx.Response, Optional[list]]]:
+        """Request the next PREFETCH_PAGES pages of releases concurrently, in page order."""
+        pages = range(first_page, first_page + PREFETCH_PAGES)
+        with ThreadPoolExecutor(max_workers=PREFETCH_PAGES) as executor:
+            return list(executor.map(lambda p: self._fetch_releases_page(repo, p, per_page), pages))
+
     def get_latest_releases(self, repo: str) -> Dict[str, Union[List[ReleaseInfo], Tuple[Optional[ReleaseInfo], Optional[ReleaseInfo]]]]:
         """Fetch latest stable and pre-release for a repository, organized by artifact."""
         artifacts_releases = {}  # Dict to store releases by artifact
@@ -301,15 +885,24 @@ class GitHubReleaseFetcher:
                 else:
                     artifacts_releases[artifact] = (None, None)  # Tuple for latest only
 
+            # Lowercase configured artifacts once for case-insensitive matching
+            lower_artifacts = [(artifact, artifact.lower()) for artifact in configured_artifacts if artifact]
+            artifacts_by_lower = {artifact_lower: artifact for artifact, artifact_lower in reversed(lower_artifacts)}
+
+            # Releases at or below the newest tag of the previous run are already saved
+            last_seen_settings = self.get_last_seen_settings(repo)
+            last_seen = self.cache.get_last_seen(repo, last_seen_settings)
+            reached = set()  # Artifacts whose last seen tag has been passed
+            newest = {}  # Newest tag per artifact in this run
+            pending = set(configured_artifacts)  # Artifacts still missing a stable or pre-release
+            stop = False
+
+            prefetched = []  # Responses for upcoming pages fetched ahead of time
             while True:
-                url = f"{GITHUB_API_BASE}/repos/{repo}/releases"
-                params = {
-                    'page': page,
-                    'per_page': per_page
-                }
-                
-                self.debug_print(f"Fetching page {page} for {repo}")
-                response = self.session.get(url, params=params)
+                if prefetched:
+                    response, releases = prefetched.pop(0)
+                else:
+                    response, releases = self._fetch_releases_page(repo, page, per_page)
                 
                 # Handle rate limiting more gracefully
                 if response.status_code == 403 and 'X-RateLimit-Remaining' in response.headers:
@@ -322,8 +915,8 @@ class GitHubReleaseFetcher:
                             print("Tip: Set GITHUB_TOKEN environment variable to increase rate limits.")
                         return artifacts_releases
 
-                response.raise_for_status()
-                releases = response.json()
+                if releases is None:
+                    response.raise_for_status()
 
                 if not releases:
                     if page == 1:
@@ -332,30 +925,44 @@ class GitHubReleaseFetcher:
                     break  # No more releases to process
 
                 for release in releases:
-                    if release['draft']:
-                        continue
+                    if release is None:
+                        continue  # Draft release
+                    release_info, release_name, release_body = release
+                    tag_name = release_info.tag
 
                     # Determine which artifact this release belongs to
-                    release_name = release['name'].lower() if release['name'] else ''
-                    release_tag = release['tag_name'].lower()
-                    release_body = release['body'].lower() if release['body'] else ''
-                    
-                    # First try to match with configured artifacts
                     matched_artifact = ''
-                    for artifact in configured_artifacts:
-                        if artifact and (
-                            (artifact.lower() in release_name) or 
-                            (artifact.lower() in release_tag) or 
-                            (artifact.lower() in release_body)
-                        ):
-                            matched_artifact = artifact
-                            self.debug_print(f"Matched release {release['tag_name']} to configured artifact {artifact}")
-                            break
+
+                    # Monorepo tags carry the artifact as a prefix, e.g. "op-node/v1.10.2"
+                    if '/' in tag_name:
+                        tag_prefix = tag_name.split('/', 1)[0].lower()
+                        matched_artifact = artifacts_by_lower.get(tag_prefix, '')
+
+                    # Otherwise look for configured artifacts in the release name and tag
+                    if not matched_artifact and lower_artifacts:
+                        release_name = release_name.lower()
+                        release_tag = tag_name.lower()
+                        for artifact, artifact_lower in lower_artifacts:
+                            if artifact_lower in release_name or artifact_lower in release_tag:
+                                matched_artifact = artifact
+                                break
+
+                    # Release bodies are large and often mention other artifacts, so only
+                    # search them as a last resort when deep matching is enabled
+                    if not matched_artifact and self.deep_match and lower_artifacts and release_body:
+                        release_body = release_body.lower()
+                        for artifact, artifact_lower in lower_artifacts:
+                            if artifact_lower in release_body:
+                                matched_artifact = artifact
+                                break
+
+                    if matched_artifact:
+                        self.debug_print(f"Matched release {tag_name} to configured artifact {matched_artifact}")
                     
                     # If no configured artifact matched, try to extract from tag
-                    if not matched_artifact and '/' in release['tag_name']:
-                        potential_artifact = release['tag_name'].split('/')[0]
-                        self.debug_print(f"Extracted potential artifact {potential_artifact} from tag {release['tag_name']}")
+                    if not matched_artifact and '/' in tag_name:
+                        potential_artifact = tag_name.split('/')[0]
+                        self.debug_print(f"Extracted potential artifact {potential_artifact} from tag {tag_name}")
                         matched_artifact = potential_artifact
                         # Initialize the new artifact based on history mode
                         if matched_artifact not in artifacts_releases:
@@ -363,12 +970,14 @@ class GitHubReleaseFetcher:
                                 artifacts_releases[matched_artifact] = []
                             else:
                                 artifacts_releases[matched_artifact] = (None, None)
-                    
-                    release_info = ReleaseInfo(
-                        release['tag_name'],
-                        release['body'] or "No release notes provided.",
-                        release['prerelease']
-                    )
+
+                    # Older than what the previous run already fetched
+                    if matched_artifact in reached:
+                        continue
+                    newest.setdefault(matched_artifact, tag_name)
+                    if last_seen.get(matched_artifact) == tag_name:
+                        self.debug_print(f"Reached last seen release {tag_name} for artifact {matched_artifact}")
+                        reached.add(matched_artifact)
 
                     if self.fetch_history:
                         # Store all releases
@@ -376,53 +985,81 @@ class GitHubReleaseFetcher:
                     else:
                         # Store only latest stable and pre-release
                         current_stable, current_pre = artifacts_releases.get(matched_artifact, (None, None))
-                        if release['prerelease'] and not current_pre:
+                        if release_info.is_prerelease and not current_pre:
                             artifacts_releases[matched_artifact] = (current_stable, release_info)
-                        elif not release['prerelease'] and not current_stable:
+                        elif not release_info.is_prerelease and not current_stable:
                             artifacts_releases[matched_artifact] = (release_info, current_pre)
 
+                        # Track artifacts still missing a release, so the stop check is O(1)
+                        stable, pre = artifacts_releases[matched_artifact]
+                        if (stable and pre) or matched_artifact in reached:
+                            pending.discard(matched_artifact)
+                        else:
+                            pending.add(matched_artifact)
+
+                    # Everything past the last seen tag of every artifact was fetched before
+                    if last_seen and reached.issuperset(last_seen):
+                        self.debug_print("Reached all last seen releases, stopping pagination")
+                        stop = True
+                        break
+
                     # Stop condition changes based on history mode
                     if not self.fetch_history:
-                        if all(stable and pre for stable, pre in artifacts_releases.values()):
+                        if not pending:
                             self.debug_print("Found all needed releases, stopping pagination")
+                            stop = True
                             break
 
                 # Check if we should continue to the next page
-                if len(releases) < per_page:
+                if stop or len(releases) < per_page:
                     break  # No more pages to fetch
                 
-                # Check rate limit
-                if 'X-RateLimit-Remaining' in response.headers:
-                    remaining = int(response.headers['X-RateLimit-Remaining'])
-                    if remaining < 1:
-                        reset_time = int(response.headers['X-RateLimit-Reset'])
-                        print(f"Warning: GitHub API rate limit reached. Resets at timestamp {reset_time}")
-                        break
-
                 page += 1
 
+                # History mode needs every page, so request the following ones in parallel
+                # instead of paying one round-trip per page. Surplus pages past the end
+                # come back empty and stop the loop.
+                if self.fetch_history and not prefetched:
+                    prefetched = self._prefetch_releases_pages(repo, page, per_page)
+
+            # Only a history run has fetched everything down to the previous cursor;
+            # latest-only runs skip older releases and must not move it
+            if self.fetch_history:
+                self._newest_tags[repo] = (newest, last_seen_settings)
             self.debug_print(f"Final artifacts_releases: {format_releases_debug(artifacts_releases)}")
             return artifacts_releases
 
-        except requests.exceptions.RequestException as e:
+        except (httpx.HTTPError, ValueError) as e:  # ValueError: the API returned invalid JSON
             print(f"Error fetching releases for {repo}: {str(e)}")
             return {'': (None, None)}
 
     def save_release_notes(self, owner: str, repo: str, artifact: str, release: ReleaseInfo) -> bool:
         """
         Save release notes to a markdown file.
-        Returns True if file was written, False if skipped.
+        Returns True if file was written, False if skipped or failed.
         """
         try:
-            # Create directory structure starting from artifacts root
-            if artifact:  # Only include artifact in path if it exists
-                base_path = Path(self.artifacts_root) / owner / repo / artifact
-            else:
-                base_path = Path(self.artifacts_root) / owner / repo
-            
-            self.debug_print(f"Creating directory structure at {base_path}")
-            base_path.mkdir(parents=True, exist_ok=True)
+            return self._save_release_notes(owner, repo, artifact, release).result()
+        except Exception:
+            return False
 
+    def _save_release_notes(self, owner: str, repo: str, artifact: str, release: ReleaseInfo) -> Future:
+        """
+        Save release notes to a markdown file, through the background writer if there is one.
+        Returns a Future resolving to True if the file was written, False if skipped,
+        or raising the error that stopped the write.
+        """
+        future = Future()
+        try:
+            # Build directory path starting from artifacts root, reusing it for sibling releases
+            base_path = self._base_paths.get((owner, repo, artifact))
+            if base_path is None:
+                if artifact:  # Only include artifact in path if it exists
+                    base_path = self.artifacts_root_path / owner / repo / artifact
+                else:
+                    base_path = self.artifacts_root_path / owner / repo
+                self._base_paths[(owner, repo, artifact)] = base_path
+            
             # Clean up tag name - remove artifact prefix if present
             tag = release.tag
             if artifact and tag.startswith(f"{artifact}/"):
@@ -432,13 +1069,6 @@ class GitHubReleaseFetcher:
             filename = f"{tag}.md"
             filepath = base_path / filename
 
-            # Check if file already exists
-            if filepath.exists():
-                self.debug_print(f"Skipping existing file: {filepath}")
-                return False
-
-            self.debug_print(f"Writing new file to {filepath}")
-
             # Prepare content
             release_type = "Pre-release" if release.is_prerelease else "Stable Release"
             full_path = f"{owner}/{repo}"
@@ -450,18 +1080,46 @@ class GitHubReleaseFetcher:
 
 {release.body}
 """
+            # Encode here so the writer only has to issue the write
+            content_bytes = content.encode('utf-8')
 
-            # Write to file
-            filepath.write_text(content, encoding='utf-8')
-            self.debug_print(f"Saved release notes to: {filepath}")
-            return True
+            # Many releases share a directory, so only create each one once
+            if base_path not in self._ensured_dirs:
+                self.debug_print(f"Creating directory structure at {base_path}")
+                base_path.mkdir(parents=True, exist_ok=True)
+                self._ensured_dirs.add(base_path)
+
+            # A single stat skips notes saved by earlier runs, which are most of them on reruns,
+            # before paying for a temporary file and a link
+            if filepath.exists():
+                self.debug_print(f"Skipping existing file: {filepath}")
+                future.set_result(False)
+                return future
+
+            self.debug_print(f"Writing new file to {filepath}")
+
+            # Hand off to the background writer if there is one, otherwise write inline
+            if self.writer:
+                self.debug_print(f"Queued release notes for: {filepath}")
+                return self.writer.submit(filepath, content_bytes)
+
+            if _write_release_file(filepath, content_bytes):
+                self.debug_print(f"Saved release notes to: {filepath}")
+                future.set_result(True)
+            else:
+                self.debug_print(f"Skipping existing file: {filepath}")
+                future.set_result(False)
         except Exception as e:
             print(f"Error saving release notes: {str(e)}")
             print(f"Debug info: owner={owner}, repo={repo}, artifact={artifact}, tag={release.tag}")
-            return False
+            future.set_exception(e)
+        return future
 
     def process_repository(self, repo: str):
         """Process a single repository and its artifacts."""
+        with self._print_lock:
+            print(f"\nProcessing repository: {repo}")
+
         try:
             owner, repo_name = repo.strip().split('/')
         except ValueError:
@@ -469,59 +1127,99 @@ class GitHubReleaseFetcher:
             return
 
         artifacts_releases = self.get_latest_releases(f"{owner}/{repo_name}")
-        summary = {}  # Track written/skipped counts per artifact
+        saves = []  # (artifact, Future) for every release note handed off
 
         if self.fetch_history:
             # Process all historical releases
             for artifact, releases in artifacts_releases.items():
-                written = skipped = 0
                 for release in releases:
-                    if self.save_release_notes(owner, repo_name, artifact, release):
-                        written += 1
-                    else:
-                        skipped += 1
-                summary[artifact] = {'written': written, 'skipped': skipped}
+                    saves.append((artifact, self._save_release_notes(owner, repo_name, artifact, release)))
         else:
             # Process only latest releases
             for artifact, (stable_release, prerelease) in artifacts_releases.items():
-                written = skipped = 0
-                if stable_release:
-                    if self.save_release_notes(owner, repo_name, artifact, stable_release):
-                        written += 1
-                    else:
-                        skipped += 1
-                if prerelease:
-                    if self.save_release_notes(owner, repo_name, artifact, prerelease):
-                        written += 1
-                    else:
-                        skipped += 1
-                summary[artifact] = {'written': written, 'skipped': skipped}
-
-        # Print summary for this repository
-        print(f"\nSummary for {repo}:")
-        for artifact, counts in summary.items():
-            artifact_path = f"{artifact}/" if artifact else ""
-            print(f"  {artifact_path}")
-            print(f"    Files: {counts['written']} written, {counts['skipped']} unchanged")
-            
-            # Show latest releases for this artifact
-            if self.fetch_history and artifacts_releases[artifact]:
-                latest = artifacts_releases[artifact][0]  # Assuming sorted by date
-                print(f"    Latest: {latest.tag}")
-            elif not self.fetch_history:
-                stable, pre = artifacts_releases[artifact]
-                if stable:
-                    print(f"    Latest stable: {stable.tag}")
-                if pre:
-                    print(f"    Latest pre-release: {pre.tag}")
+                for release in (stable_release, prerelease):
+                    if release:
+                        saves.append((artifact, self._save_release_notes(owner, repo_name, artifact, release)))
+
+        # Report once every note has been written, without holding up this worker; the
+        # last write to finish runs the report, on the writer thread if there is one
+        pending = [len(saves)]
+        pending_lock = threading.Lock()
+
+        def on_saved(_):
+            with pending_lock:
+                pending[0] -= 1
+                done = pending[0] == 0
+            if done:
+                self._report_repository(repo, f"{owner}/{repo_name}", artifacts_releases, saves)
+
+        if not saves:
+            self._report_repository(repo, f"{owner}/{repo_name}", artifacts_releases, saves)
+        for _, future in saves:
+            future.add_done_callback(on_saved)
+
+    def _report_repository(self, repo: str, full_name: str, artifacts_releases: dict, saves: List[Tuple[str, Future]]):
+        """Record the last seen tags and print the summary for a repository whose notes are all written."""
+        try:
+            summary = {artifact: {'written': 0, 'skipped': 0, 'failed': 0} for artifact in artifacts_releases}
+            for artifact, future in saves:
+                if future.exception() is not None:
+                    summary[artifact]['failed'] += 1
+                else:
+                    summary[artifact]['written' if future.result() else 'skipped'] += 1
+            failed = sum(counts['failed'] for counts in summary.values())
+
+            # Remember where this run started so the next one can stop there, unless a
+            # note is missing and needs to be fetched again
+            newest = self._newest_tags.pop(full_name, None)
+            if newest and newest[0] and not failed:
+                self.cache.set_last_seen(full_name, *newest)
+
+            # Print summary for this repository as one block so parallel workers don't interleave
+            lines = [f"\nSummary for {repo}:"]
+            for artifact, counts in summary.items():
+                artifact_path = f"{artifact}/" if artifact else ""
+                lines.append(f"  {artifact_path}")
+                files_line = f"    Files: {counts['written']} written, {counts['skipped']} unchanged"
+                if counts['failed']:
+                    files_line += f", {counts['failed']} failed"
+                lines.append(files_line)
+
+                # Show latest releases for this artifact
+                if self.fetch_history and artifacts_releases[artifact]:
+                    latest = artifacts_releases[artifact][0]  # Assuming sorted by date
+                    lines.append(f"    Latest: {latest.tag}")
+                elif not self.fetch_history:
+                    stable, pre = artifacts_releases[artifact]
+                    if stable:
+                        lines.append(f"    Latest stable: {stable.tag}")
+                    if pre:
+                        lines.append(f"    Latest pre-release: {pre.tag}")
+            with self._print_lock:
+                print("\n".join(lines))
+        except Exception as e:
+            print(f"Error reporting repository {repo}: {str(e)}")
 
 def main():
     fetcher = GitHubReleaseFetcher()
     repositories = fetcher.get_repositories()
+    fetcher.writer = fetcher.create_writer()
 
-    for repo in repositories:
-        print(f"\nProcessing repository: {repo}")
-        fetcher.process_repository(repo)
+    def process_repository(repo: str):
+        # Keep one failing repository from aborting the others
+        try:
+            fetcher.process_repository(repo)
+        except Exception as e:
+            print(f"Error processing repository {repo}: {str(e)}")
+
+    try:
+        # Repositories are I/O bound on GitHub round-trips, so fetch them in parallel
+        with ThreadPoolExecutor(max_workers=fetcher.concurrency) as executor:
+            list(executor.map(process_repository, repositories))
+    finally:
+        # Wait for queued release notes to reach disk, and their repositories to be
+        # reported, before exiting
+        fetcher.writer.join()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -1,8 +1,11 @@
 import os
+import json
+import errno
+import threading
 import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch
-from get_latest_releases import GitHubReleaseFetcher, ReleaseInfo
+from get_latest_releases import GitHubReleaseFetcher, ReleaseInfo, ReleaseNoteWriter
 import configparser
 
 # Test data
@@ -44,12 +47,12 @@ MOCK_RELEASES = [
 @pytest.fixture
 def mock_session():
     """Create a mock session with predefined responses."""
-    with patch('requests.Session') as mock:
+    with patch('httpx.Client') as mock:
         session = Mock()
         
         # Mock rate limit response
         rate_limit_response = Mock()
-        rate_limit_response.json.return_value = {
+        rate_limit_response.content = json.dumps({
             'resources': {
                 'core': {
                     'limit': 5000,
@@ -57,19 +60,27 @@ def mock_session():
                     'reset': 1234567890
                 }
             }
-        }
+        }).encode()
         rate_limit_response.raise_for_status.return_value = None
         
         # Mock releases response
         releases_response = Mock()
-        releases_response.json.return_value = MOCK_RELEASES
+        releases_response.content = json.dumps(MOCK_RELEASES).encode()
         releases_response.raise_for_status.return_value = None
+        releases_response.is_error = False
         releases_response.headers = {'X-RateLimit-Remaining': '4999'}
         
         session.get.side_effect = [rate_limit_response, releases_response]
         mock.return_value = session
         yield mock
 
+def respond_with_releases(session, releases):
+    """Make every request on a mocked session return a single page with the given releases."""
+    session.get.side_effect = None
+    session.get.return_value.content = json.dumps(releases).encode()
+    session.get.return_value.is_error = False
+    session.get.return_value.headers = {'X-RateLimit-Remaining': '4999'}
+
 @pytest.fixture
 def temp_artifacts_dir(tmp_path):
     """Create a temporary directory for artifacts."""
@@ -159,6 +170,35 @@ def test_skip_existing_files(fetcher, temp_artifacts_dir):
     result2 = fetcher.save_release_notes('owner', 'repo', '', release)
     assert not result2  # Should return False for skipped file
 
+def test_failed_write_leaves_no_file(fetcher, temp_artifacts_dir):
+    """Test an interrupted write leaves neither the note nor its temporary file behind."""
+    release = ReleaseInfo('v1.0.0', 'Test release notes', False)
+
+    with patch('os.write', side_effect=OSError("No space left on device")):
+        assert not fetcher.save_release_notes('owner', 'repo', '', release)
+
+    assert list((temp_artifacts_dir / 'owner' / 'repo').iterdir()) == []
+
+    # The next run writes the note instead of treating it as existing
+    assert fetcher.save_release_notes('owner', 'repo', '', release)
+    assert 'Test release notes' in (temp_artifacts_dir / 'owner' / 'repo' / 'v1.0.0.md').read_text()
+
+def test_save_without_hard_links(fetcher, temp_artifacts_dir):
+    """Test notes are still written on filesystems that do not support hard links."""
+    release = ReleaseInfo('v1.0.0', 'Test release notes', False)
+
+    with patch('os.link', side_effect=OSError(errno.EPERM, "Operation not permitted")) as mock_link, \
+         patch('get_latest_releases._no_link_dirs', set()):
+        assert fetcher.save_release_notes('owner', 'repo', '', release)
+        assert fetcher.save_release_notes('owner', 'repo', '', ReleaseInfo('v1.0.1', 'More notes', False))
+        assert not fetcher.save_release_notes('owner', 'repo', '', release)
+
+    # Only the first note tried to link before the directory was written in place
+    assert mock_link.call_count == 1
+    base_path = temp_artifacts_dir / 'owner' / 'repo'
+    assert sorted(p.name for p in base_path.iterdir()) == ['v1.0.0.md', 'v1.0.1.md']
+    assert 'Test release notes' in (base_path / 'v1.0.0.md').read_text()
+
 def test_process_repository(fetcher, temp_artifacts_dir):
     """Test processing an entire repository."""
     fetcher.process_repository('test/repo')
@@ -226,4 +266,361 @@ def test_history_mode_configuration():
          patch('os.path.exists', return_value=False), \
          patch('sys.argv', ['script.py']):
         fetcher = GitHubReleaseFetcher()
-        assert not fetcher.fetch_history 
\ No newline at end of file
+        assert not fetcher.fetch_history 
+
+def test_concurrency_configuration(mock_session):
+    """Test parallel fetch concurrency can be configured and defaults sensibly."""
+    with patch.dict(os.environ, {'GH_CONCURRENCY': '3'}):
+        fetcher = GitHubReleaseFetcher()
+        assert fetcher.concurrency == 3
+
+    with patch.dict(os.environ, {}, clear=True), \
+         patch('os.path.exists', return_value=False), \
+         patch('sys.argv', ['script.py']):
+        fetcher = GitHubReleaseFetcher()
+        assert fetcher.concurrency == 8
+
+
+def test_history_mode_pagination(fetcher):
+    """Test history mode walks every page, fetching later pages concurrently."""
+    full_page = [
+        {'tag_name': f'v1.0.{i}', 'name': f'Version 1.0.{i}', 'body': 'Notes',
+         'draft': False, 'prerelease': False}
+        for i in range(100)
+    ]
+    pages = {1: full_page, 2: MOCK_RELEASES}
+
+    def get(url, params=None, **kwargs):
+        response = Mock()
+        response.content = json.dumps(pages.get(params['page'], [])).encode()
+        response.raise_for_status.return_value = None
+        response.is_error = False
+        response.headers = {'X-RateLimit-Remaining': '4999'}
+        return response
+
+    fetcher.session.get.side_effect = get
+    fetcher.fetch_history = True
+    releases = fetcher.get_latest_releases("test/repo")
+
+    assert len(releases['']) == 102  # 100 from page 1, v1.0.0 and v2.0.0-rc1 from page 2
+    assert len(releases['op-node']) == 1
+
+
+def test_etag_cache_revalidation(fetcher):
+    """Test unchanged release pages are served from the ETag cache on 304."""
+    first = Mock(status_code=200, is_error=False, content=json.dumps(MOCK_RELEASES).encode())
+    first.headers = {'ETag': '"abc123"', 'X-RateLimit-Remaining': '4999'}
+    not_modified = Mock(status_code=304, is_error=False)
+    not_modified.headers = {'X-RateLimit-Remaining': '4999'}
+    fetcher.session.get.side_effect = [first, not_modified]
+
+    fetcher.get_latest_releases("test/repo")
+    releases = fetcher.get_latest_releases("test/repo")
+
+    _, kwargs = fetcher.session.get.call_args
+    assert kwargs['headers'] == {'If-None-Match': '"abc123"'}
+    stable, _ = releases['']
+    assert stable.tag == 'v1.0.0'
+
+
+def test_background_writer(fetcher, temp_artifacts_dir):
+    """Test release notes queued on the background writer are written after join."""
+    fetcher.writer = ReleaseNoteWriter()
+    release = ReleaseInfo('op-node/v1.0.0', 'Test monorepo notes', False)
+
+    assert fetcher.save_release_notes('owner', 'repo', 'op-node', release)
+    fetcher.writer.join()
+
+    filepath = temp_artifacts_dir / 'owner' / 'repo' / 'op-node' / 'v1.0.0.md'
+    assert 'Test monorepo notes' in filepath.read_text()
+
+
+def test_uring_writer_fallback(fetcher):
+    """Test io_uring writes fall back to the standard writer without liburing."""
+    with patch.dict(os.environ, {'GITHUB_RELEASES_URING': 'true'}), \
+         patch('get_latest_releases.liburing', None):
+        writer = fetcher.create_writer()
+    assert type(writer) is ReleaseNoteWriter
+
+
+def test_uring_writer(fetcher, temp_artifacts_dir, capsys):
+    """Test release notes written through io_uring reach disk intact."""
+    pytest.importorskip('liburing')
+    from get_latest_releases import UringReleaseNoteWriter
+
+    fetcher.writer = UringReleaseNoteWriter()
+    for i in range(3):
+        release = ReleaseInfo(f'op-node/v1.0.{i}', f'Notes {i} ' * 1000, False)
+        assert fetcher.save_release_notes('owner', 'repo', 'op-node', release)
+    fetcher.writer.join()
+
+    assert 'Warning' not in capsys.readouterr().out
+    base_path = temp_artifacts_dir / 'owner' / 'repo' / 'op-node'
+    assert sorted(p.name for p in base_path.iterdir()) == ['v1.0.0.md', 'v1.0.1.md', 'v1.0.2.md']
+    for i in range(3):
+        assert (base_path / f'v1.0.{i}.md').read_text().endswith(f'Notes {i} ' * 1000 + '\n')
+
+
+def test_invalid_json_response(fetcher, capsys):
+    """Test an undecodable release page is reported like other fetch errors."""
+    respond_with_releases(fetcher.session, [])
+    fetcher.session.get.return_value.content = b'<html>Bad gateway</html>'
+
+    assert fetcher.get_latest_releases("test/repo") == {'': (None, None)}
+    assert "Error fetching releases for test/repo" in capsys.readouterr().out
+
+
+def test_corrupt_cached_page_is_refetched(fetcher):
+    """Test a cached page that no longer decodes is fetched again instead of failing."""
+    url = "https://api.github.com/repos/test/repo/releases?page=1&per_page=100"
+    fetcher.cache.put(url, '"abc"', b'not json')
+
+    not_modified = Mock(status_code=304, headers={})
+    fresh = Mock(status_code=200, is_error=False, headers={}, content=json.dumps(MOCK_RELEASES).encode())
+    fetcher.session.get.side_effect = [not_modified, fresh]
+
+    response, releases = fetcher._fetch_releases_page("test/repo", 1, 100)
+
+    assert response is fresh
+    assert releases[0][0].tag == 'v1.0.0'
+    # The page is requested again without the stale ETag
+    assert 'headers' not in fetcher.session.get.call_args.kwargs
+
+
+def test_last_seen_stops_pagination(fetcher):
+    """Test pagination stops at the newest tags recorded by a previous run."""
+    fetcher.fetch_history = True
+    fetcher.cache.set_last_seen("test/repo", {'': 'v1.0.0', 'op-node': 'op-node/v1.10.2'},
+                                fetcher.get_last_seen_settings("test/repo"))
+
+    releases = fetcher.get_latest_releases("test/repo")
+
+    # v2.0.0-rc1 is older than the last seen v1.0.0 and is not collected again
+    assert [r.tag for r in releases['']] == ['v1.0.0']
+    assert [r.tag for r in releases['op-node']] == ['op-node/v1.10.2']
+
+
+def test_process_repository_records_last_seen(fetcher):
+    """Test processing a repository in history mode records the newest tag per artifact."""
+    fetcher.fetch_history = True
+    fetcher.process_repository('test/repo')
+
+    assert fetcher.cache.get_last_seen('test/repo') == {'': 'v1.0.0', 'op-node': 'op-node/v1.10.2'}
+
+
+def test_latest_only_run_keeps_history_complete(fetcher, temp_artifacts_dir):
+    """Test a latest-only run does not stop a later history run from fetching older releases."""
+    releases = [
+        {'tag_name': f'v1.0.{i}', 'name': f'Release v1.0.{i}', 'body': f'Notes {i}',
+         'draft': False, 'prerelease': False}
+        for i in range(5, 0, -1)
+    ]
+
+    def get(url, params=None, headers=None):
+        response = Mock()
+        response.content = json.dumps(releases if params['page'] == 1 else []).encode()
+        response.is_error = False
+        response.headers = {}
+        return response
+
+    fetcher.session.get.side_effect = get
+    fetcher.process_repository('test/repo')
+    assert fetcher.cache.get_last_seen('test/repo') == {}
+
+    fetcher.fetch_history = True
+    fetcher.process_repository('test/repo')
+
+    base_path = temp_artifacts_dir / 'test' / 'repo'
+    assert sorted(p.name for p in base_path.iterdir()) == [f'v1.0.{i}.md' for i in range(1, 6)]
+    assert fetcher.cache.get_last_seen('test/repo') == {'': 'v1.0.5'}
+
+
+def test_added_artifact_ignores_last_seen(fetcher, temp_artifacts_dir):
+    """Test adding an artifact to the config fetches its older releases despite the last seen tags."""
+    releases = [
+        {'tag_name': f'v1.0.{i}', 'name': f'op-batcher v1.0.{i}' if i == 2 else f'Release v1.0.{i}',
+         'body': f'Notes {i}', 'draft': False, 'prerelease': False}
+        for i in range(5, 0, -1)
+    ]
+
+    def get(url, params=None, headers=None):
+        response = Mock()
+        response.content = json.dumps(releases if params['page'] == 1 else []).encode()
+        response.is_error = False
+        response.headers = {}
+        return response
+
+    fetcher.session.get.side_effect = get
+    fetcher.fetch_history = True
+    fetcher.process_repository('test/repo')
+    assert fetcher.cache.get_last_seen('test/repo') == {'': 'v1.0.5'}
+
+    # A later run with op-batcher configured next to the root releases
+    fetcher._mono_cache.clear()
+    with patch.dict(os.environ, {'MONOREPO_ARTIFACTS_TEST_REPO': ',op-batcher'}):
+        fetcher.process_repository('test/repo')
+
+    assert (temp_artifacts_dir / 'test' / 'repo' / 'op-batcher' / 'v1.0.2.md').exists()
+    assert fetcher.cache.get_last_seen('test/repo') == {'': 'v1.0.5', 'op-batcher': 'v1.0.2'}
+
+
+def test_process_repository_does_not_wait_for_writes(fetcher, temp_artifacts_dir, capsys):
+    """Test a repository is handed off without waiting for its notes to reach disk."""
+    fetcher.writer = ReleaseNoteWriter()
+    fetcher.fetch_history = True
+    release_writes = threading.Event()
+
+    def write(filepath, content):
+        release_writes.wait(5)
+        return True
+
+    with patch('get_latest_releases._write_release_file', side_effect=write):
+        fetcher.process_repository('test/repo')
+        assert "Summary for test/repo" not in capsys.readouterr().out
+        assert fetcher.cache.get_last_seen('test/repo') == {}
+
+        release_writes.set()
+        fetcher.writer.join()
+
+    assert "Files: 2 written, 0 unchanged" in capsys.readouterr().out
+    assert fetcher.cache.get_last_seen('test/repo') == {'': 'v1.0.0', 'op-node': 'op-node/v1.10.2'}
+
+
+def test_process_repository_reports_writer_failures(fetcher, temp_artifacts_dir, capsys):
+    """Test failed background writes are counted and keep the last seen tags from being recorded."""
+    fetcher.writer = ReleaseNoteWriter()
+
+    with patch('get_latest_releases._write_release_file', side_effect=OSError("Disk full")):
+        fetcher.process_repository('test/repo')
+        fetcher.writer.join()
+
+    out = capsys.readouterr().out
+    assert "Files: 0 written, 0 unchanged, 1 failed" in out
+    assert fetcher.cache.get_last_seen('test/repo') == {}
+
+
+def test_configured_artifact_matching(fetcher):
+    """Test releases are matched to configured artifacts by name and tag, and by body when enabled."""
+    releases = [
+        {'tag_name': 'v1.0.0', 'name': 'OP-Batcher v1.0.0', 'body': 'Batcher notes',
+         'draft': False, 'prerelease': False},
+        {'tag_name': 'v0.9.0', 'name': 'Release v0.9.0', 'body': 'Changes to op-batcher',
+         'draft': False, 'prerelease': True},
+    ]
+    respond_with_releases(fetcher.session, releases)
+
+    with patch.dict(os.environ, {'MONOREPO_ARTIFACTS_TEST_REPO': 'op-batcher'}):
+        result = fetcher.get_latest_releases("test/repo")
+
+        # Release notes are only searched with deep matching enabled
+        stable, pre = result['op-batcher']
+        assert stable.tag == 'v1.0.0'
+        assert pre is None
+        assert result[''][1].tag == 'v0.9.0'
+
+        fetcher.deep_match = True
+        result = fetcher.get_latest_releases("test/repo")
+
+    stable, pre = result['op-batcher']
+    assert stable.tag == 'v1.0.0'
+    assert pre.tag == 'v0.9.0'
+
+
+def test_rate_limit_throttling(fetcher):
+    """Test concurrent requests share one pacing schedule once the rate limit runs low."""
+    fetcher._update_rate_limit(5000, 10, 1000 + 100)
+    fetcher.session.get.side_effect = None
+    fetcher.session.get.return_value.headers = {}
+    sleeps = []
+
+    with patch('time.time', return_value=1000), \
+         patch('time.sleep', side_effect=sleeps.append):
+        threads = [
+            threading.Thread(target=fetcher._get_throttled, args=("https://api.github.com/x",))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    # The first call goes out immediately, the rest get successive slots spread
+    # evenly over the time until reset
+    assert sorted(sleeps) == pytest.approx([10.0, 20.0, 30.0, 40.0])
+    assert fetcher._rl_remaining == 5
+
+
+def test_rate_limit_not_modified_is_free(fetcher):
+    """Test revalidated pages do not use up the paced rate limit budget."""
+    fetcher._update_rate_limit(60, 5, 1000 + 3000)
+    fetcher.session.get.side_effect = None
+    fetcher.session.get.return_value.status_code = 304
+    fetcher.session.get.return_value.headers = {}
+    clock = [1000.0]
+
+    def sleep(seconds):
+        clock[0] += seconds
+
+    with patch('time.time', side_effect=lambda: clock[0]), \
+         patch('time.sleep', side_effect=sleep):
+        for _ in range(7):
+            fetcher._get_throttled("https://api.github.com/x")
+
+    assert fetcher._rl_remaining == 5
+    assert clock[0] < 1000 + 3000
+
+
+def test_rate_limit_exhausted_waits_for_reset(fetcher):
+    """Test requests wait for the reset once the rate limit is used up."""
+    fetcher._update_rate_limit(5000, 0, 1000 + 300)
+    fetcher.session.get.side_effect = None
+    fetcher.session.get.return_value.headers = {}
+
+    with patch('time.time', return_value=1000), \
+         patch('time.sleep') as mock_sleep:
+        fetcher._get_throttled("https://api.github.com/x")
+        fetcher._get_throttled("https://api.github.com/x")
+
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [300, 300]
+
+
+def test_monorepo_artifacts_command_line(mock_session):
+    """Test per-repository artifact flags are parsed for every configured repository."""
+    argv = ['script.py', '--repos', 'ethereum-optimism/optimism,test/repo',
+            '--artifacts-ethereum-optimism-optimism', 'op-node,op-batcher']
+    with patch.dict(os.environ, {}, clear=True), patch('sys.argv', argv):
+        fetcher = GitHubReleaseFetcher()
+
+    assert fetcher.get_monorepo_artifacts('ethereum-optimism/optimism') == ['op-node', 'op-batcher']
+    assert fetcher.get_monorepo_artifacts('test/repo') == ['']
+
+
+def test_tag_prefix_matching(fetcher):
+    """Test a configured artifact in the tag prefix wins over names mentioning other artifacts."""
+    releases = [
+        {'tag_name': 'op-node/v1.0.0', 'name': 'op-node v1.0.0 (needs op-batcher v2)', 'body': '',
+         'draft': False, 'prerelease': False},
+    ]
+    respond_with_releases(fetcher.session, releases)
+
+    with patch.dict(os.environ, {'MONOREPO_ARTIFACTS_TEST_REPO': 'op-batcher,op-node'}):
+        result = fetcher.get_latest_releases("test/repo")
+
+    assert result['op-node'][0].tag == 'op-node/v1.0.0'
+    assert result['op-batcher'] == (None, None)
+
+
+def test_deep_match_skips_empty_notes(fetcher):
+    """Test deep matching never matches the placeholder used for releases without notes."""
+    releases = [
+        {'tag_name': 'v1.0.0', 'name': 'Version 1.0.0', 'body': None,
+         'draft': False, 'prerelease': False},
+    ]
+    respond_with_releases(fetcher.session, releases)
+    fetcher.deep_match = True
+
+    with patch.dict(os.environ, {'MONOREPO_ARTIFACTS_TEST_REPO': 'notes'}):
+        result = fetcher.get_latest_releases("test/repo")
+
+    assert result['notes'] == (None, None)
+    assert result[''][0].body == 'No release notes provided.'